@@ -84,10 +84,13 @@ class ABTestFramework:
         self, user_ids: List[str], treatment_ratio: float = 0.5, seed: int = 42
     ) -> Tuple[List[str], List[str]]:
         """Randomly assign users to groups."""
-        np.random.seed(seed)
-        shuffled = np.random.permutation(user_ids)
-        split_idx = int(len(shuffled) * (1 - treatment_ratio))
-        return list(shuffled[:split_idx]), list(shuffled[split_idx:])
+        # Permute an integer index and slice it, so only ids (not copies of
+        # the full id array) move between groups
+        rng = np.random.default_rng(seed)
+        users = np.asarray(user_ids, dtype=object)
+        idx = rng.permutation(len(users))
+        split_idx = int(len(users) * (1 - treatment_ratio))
+        return list(users[idx[:split_idx]]), list(users[idx[split_idx:]])
     
     def analyze_results(
         self, experiment_name: str, metric_data: pd.DataFrame, 
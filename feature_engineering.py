@@ -21,6 +21,39 @@ from datetime import datetime, timedelta
 from scipy import stats
 from loguru import logger
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, cache=True)
+    def _temporal_features_numba(ts_hours: np.ndarray):
+        """
+        Derive hour / day-of-week / period flags from timestamps.
+
+        One fused parallel pass over int64 hours-since-epoch instead of
+        five separate pandas .dt passes (each of which materializes its
+        own intermediate array).
+        """
+        n = ts_hours.shape[0]
+        hour = np.empty(n, dtype=np.int64)
+        day_of_week = np.empty(n, dtype=np.int64)
+        is_weekend = np.empty(n, dtype=np.int64)
+        is_morning = np.empty(n, dtype=np.int64)
+        is_evening = np.empty(n, dtype=np.int64)
+        for i in numba.prange(n):
+            h = ts_hours[i] % 24
+            # 1970-01-01 was a Thursday (weekday 3)
+            d = (ts_hours[i] // 24 + 3) % 7
+            hour[i] = h
+            day_of_week[i] = d
+            is_weekend[i] = 1 if d >= 5 else 0
+            is_morning[i] = 1 if 6 <= h < 12 else 0
+            is_evening[i] = 1 if h >= 18 else 0
+        return hour, day_of_week, is_weekend, is_morning, is_evening
+
 
 class FeatureEngineer:
     """
@@ -422,11 +455,16 @@ def create_skip_prediction_features(
     
     df = sessions.merge(tracks, on='track_id', how='left')
     
-    df['hour'] = df['timestamp'].dt.hour
-    df['day_of_week'] = df['timestamp'].dt.dayofweek
-    df['is_weekend'] = (df['day_of_week'] >= 5).astype(int)
-    df['is_morning'] = ((df['hour'] >= 6) & (df['hour'] < 12)).astype(int)
-    df['is_evening'] = ((df['hour'] >= 18) & (df['hour'] < 24)).astype(int)
+    if NUMBA_AVAILABLE:
+        ts_hours = df['timestamp'].to_numpy().astype('datetime64[h]').view(np.int64)
+        (df['hour'], df['day_of_week'], df['is_weekend'],
+         df['is_morning'], df['is_evening']) = _temporal_features_numba(ts_hours)
+    else:
+        df['hour'] = df['timestamp'].dt.hour
+        df['day_of_week'] = df['timestamp'].dt.dayofweek
+        df['is_weekend'] = (df['day_of_week'] >= 5).astype(int)
+        df['is_morning'] = ((df['hour'] >= 6) & (df['hour'] < 12)).astype(int)
+        df['is_evening'] = ((df['hour'] >= 18) & (df['hour'] < 24)).astype(int)
     
     context_dummies = pd.get_dummies(df['context'], prefix='context')
     df = pd.concat([df, context_dummies], axis=1)
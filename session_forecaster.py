@@ -12,12 +12,16 @@ Model Performance:
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple, Any
-import pickle
+import joblib
 from pathlib import Path
 
+from scipy import stats
+from scipy.linalg.blas import sgemv
+
 from sklearn.linear_model import LinearRegression, Ridge, Lasso
+from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split, cross_val_score
+from sklearn.model_selection import cross_val_score
 from sklearn.metrics import (
     mean_squared_error, mean_absolute_error, r2_score
 )
@@ -25,6 +29,19 @@ from sklearn.feature_selection import SelectKBest, f_regression
 
 from loguru import logger
 
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+try:
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+    SKL2ONNX_AVAILABLE = True
+except ImportError:
+    SKL2ONNX_AVAILABLE = False
+
 
 class SessionForecaster:
     """
@@ -68,8 +85,14 @@ class SessionForecaster:
         self.feature_names: List[str] = []
         self.selected_features: List[str] = []
         self.is_fitted: bool = False
-        
+
         self._metrics: Dict[str, float] = {}
+
+        # Fused float32 scoring weights (scaler + selector + model in one
+        # affine map) and the selector's columns as integer positions
+        self._w32: Optional[np.ndarray] = None
+        self._b32: Optional[np.float32] = None
+        self._sel_cols: Optional[np.ndarray] = None
     
     def train(
         self,
@@ -93,12 +116,15 @@ class SessionForecaster:
         # Store feature names
         self.feature_names = list(X.columns)
         
-        # Split data
-        X_train, X_val, y_train, y_val = train_test_split(
-            X, y,
-            test_size=validation_split,
-            random_state=self.random_state
-        )
+        # Split data via permuted indices instead of train_test_split, which
+        # materializes four full copies and doubles peak memory
+        rng = np.random.default_rng(self.random_state)
+        idx = rng.permutation(len(X))
+        split = int(len(X) * (1 - validation_split))
+        train_idx, val_idx = idx[:split], idx[split:]
+        X_train, X_val = X.iloc[train_idx], X.iloc[val_idx]
+        y_arr = np.asarray(y)
+        y_train, y_val = y_arr[train_idx], y_arr[val_idx]
         
         # Scale features
         self.scaler = StandardScaler()
@@ -117,18 +143,29 @@ class SessionForecaster:
             self.feature_names[i] for i, selected in enumerate(selected_mask) if selected
         ]
         
-        # Train model
-        if self.model_type == 'linear':
-            self.model = LinearRegression()
-        elif self.model_type == 'ridge':
-            self.model = Ridge(alpha=self.alpha, random_state=self.random_state)
-        elif self.model_type == 'lasso':
-            self.model = Lasso(alpha=self.alpha, random_state=self.random_state)
-        else:
-            raise ValueError(f"Unknown model type: {self.model_type}")
+        # Train model. The estimator is kept across repeated train() calls;
+        # Lasso warm-starts its coordinate descent from the previous
+        # coefficients (LinearRegression and Ridge solve in closed form, so
+        # there is nothing to warm-start)
+        if self.model is None:
+            if self.model_type == 'linear':
+                self.model = LinearRegression()
+            elif self.model_type == 'ridge':
+                self.model = Ridge(
+                    alpha=self.alpha, random_state=self.random_state
+                )
+            elif self.model_type == 'lasso':
+                self.model = Lasso(
+                    alpha=self.alpha,
+                    random_state=self.random_state,
+                    warm_start=True
+                )
+            else:
+                raise ValueError(f"Unknown model type: {self.model_type}")
         
         self.model.fit(X_train_selected, y_train)
         self.is_fitted = True
+        self._compute_fast_weights()
         
         # Calculate metrics
         train_pred = self.model.predict(X_train_selected)
@@ -159,9 +196,45 @@ class SessionForecaster:
             Predicted durations
         """
         self._check_fitted()
-        X_scaled = self.scaler.transform(X[self.feature_names])
-        X_selected = self.feature_selector.transform(X_scaled)
-        return self.model.predict(X_selected)
+        X32 = self._as_float32(X)
+        # X32.T is Fortran-ordered, so trans=1 computes X32 @ w without a copy
+        return sgemv(1.0, X32.T, self._w32, trans=1) + self._b32
+
+    def _as_float32(self, X) -> np.ndarray:
+        """
+        Extract the feature matrix as float32 without unnecessary copies.
+
+        ndarrays (assumed to be in training column order) pass straight
+        through, and DataFrames whose columns already match skip the
+        label-based reselection copy.
+        """
+        if isinstance(X, np.ndarray):
+            return X.astype(np.float32, copy=False)
+        if list(X.columns) == self.feature_names:
+            return X.to_numpy(dtype=np.float32)
+        return X[self.feature_names].to_numpy(dtype=np.float32)
+
+    def _compute_fast_weights(self) -> None:
+        """
+        Fold scaler, feature selector, and model into one affine transform.
+
+        Unselected columns get a zero weight, so scoring is a single BLAS
+        sgemv over the full feature matrix instead of a scaler.transform
+        copy, a selector gather, and a float64 matmul. The selector's
+        boolean mask is converted to integer positions once, so anything
+        that still needs the selected columns can take() them directly
+        instead of re-deriving the mask per call.
+        """
+        self._sel_cols = np.flatnonzero(
+            self.feature_selector.get_support()
+        ).astype(np.int32)
+        coef = np.zeros(len(self.feature_names))
+        coef[self._sel_cols] = self.model.coef_
+        w_scaled = coef / self.scaler.scale_
+        self._w32 = w_scaled.astype(np.float32)
+        self._b32 = np.float32(
+            float(self.model.intercept_) - np.dot(w_scaled, self.scaler.mean_)
+        )
     
     def evaluate(
         self,
@@ -183,28 +256,36 @@ class SessionForecaster:
         self._check_fitted()
         
         y_pred = self.predict(X)
-        
+
+        # Fuse the MAPE elementwise ops into one cache-blocked pass instead
+        # of three full-length float64 temporaries
+        y_arr = np.asarray(y, dtype=np.float64)
+        if NUMEXPR_AVAILABLE:
+            mape = float(ne.evaluate('sum(abs((y_arr - y_pred) / y_arr))')) / len(y_arr) * 100
+        else:
+            mape = np.mean(np.abs((y_arr - y_pred) / y_arr)) * 100
+
         metrics = {
             'r2': r2_score(y, y_pred),
             'rmse': np.sqrt(mean_squared_error(y, y_pred)),
             'mae': mean_absolute_error(y, y_pred),
-            'mape': np.mean(np.abs((y - y_pred) / y)) * 100
+            'mape': mape
         }
         
         if verbose:
+            # Deferred formatting: loguru only renders these if the level
+            # is enabled, so a scoring service pays nothing per batch
             logger.info("\n" + "="*50)
             logger.info("Session Forecaster Evaluation")
             logger.info("="*50)
-            logger.info(f"R² Score: {metrics['r2']:.4f}")
-            logger.info(f"RMSE: {metrics['rmse']:.2f}")
-            logger.info(f"MAE: {metrics['mae']:.2f}")
-            logger.info(f"MAPE: {metrics['mape']:.2f}%")
-            
+            logger.info("R² Score: {:.4f}", metrics['r2'])
+            logger.info("RMSE: {:.2f}", metrics['rmse'])
+            logger.info("MAE: {:.2f}", metrics['mae'])
+            logger.info("MAPE: {:.2f}%", metrics['mape'])
+
             # Convert to minutes for interpretation
-            rmse_minutes = metrics['rmse'] / (1000 * 60)
-            mae_minutes = metrics['mae'] / (1000 * 60)
-            logger.info(f"\nRMSE: {rmse_minutes:.2f} minutes")
-            logger.info(f"MAE: {mae_minutes:.2f} minutes")
+            logger.info("\nRMSE: {:.2f} minutes", metrics['rmse'] / (1000 * 60))
+            logger.info("MAE: {:.2f} minutes", metrics['mae'] / (1000 * 60))
         
         return metrics
     
@@ -226,18 +307,22 @@ class SessionForecaster:
             Cross-validation scores
         """
         logger.info(f"Running {cv}-fold cross-validation...")
-        
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
-        
+
         if self.model_type == 'linear':
             model = LinearRegression()
         elif self.model_type == 'ridge':
             model = Ridge(alpha=self.alpha)
         else:
             model = Lasso(alpha=self.alpha)
-        
-        scores = cross_val_score(model, X_scaled, y, cv=cv, scoring='r2')
+
+        # Scaling inside the pipeline keeps each fold's scaler fit on its
+        # training split only (no leakage) and avoids a full scaled copy of X
+        pipeline = Pipeline([
+            ('scaler', StandardScaler()),
+            ('model', model)
+        ])
+
+        scores = cross_val_score(pipeline, X, y, cv=cv, scoring='r2', n_jobs=-1)
         
         results = {
             'cv_r2_mean': scores.mean(),
@@ -287,26 +372,67 @@ class SessionForecaster:
             Residual statistics and data
         """
         self._check_fitted()
-        
+
         y_pred = self.predict(X)
-        residuals = y - y_pred
-        
+        residuals = np.asarray(y, dtype=np.float32) - y_pred
+
+        # Single C-level pass over the residuals instead of six separate
+        # pandas reductions; bias=False matches pandas' corrected estimators
+        desc = stats.describe(residuals, bias=False)
+
         return {
             'residuals': residuals,
-            'mean': residuals.mean(),
-            'std': residuals.std(),
-            'min': residuals.min(),
-            'max': residuals.max(),
-            'skewness': residuals.skew(),
-            'kurtosis': residuals.kurtosis()
+            'mean': desc.mean,
+            'std': np.sqrt(desc.variance),
+            'min': desc.minmax[0],
+            'max': desc.minmax[1],
+            'skewness': desc.skewness,
+            'kurtosis': desc.kurtosis
         }
     
-    def save(self, filepath: str) -> None:
+    def export_onnx(self, filepath: str) -> None:
         """
-        Save model to file.
-        
+        Export the fitted scaler + selector + model pipeline to ONNX.
+
+        The exported graph runs under ONNXRuntime's fused kernels,
+        bypassing sklearn's per-call validation overhead for production
+        scoring.
+
         Args:
-            filepath: Path to save model
+            filepath: Path to write the .onnx file
+        """
+        self._check_fitted()
+
+        if not SKL2ONNX_AVAILABLE:
+            raise ImportError(
+                "skl2onnx is required for ONNX export. "
+                "Install with: pip install skl2onnx"
+            )
+
+        pipeline = Pipeline([
+            ('scaler', self.scaler),
+            ('selector', self.feature_selector),
+            ('model', self.model)
+        ])
+        onnx_model = convert_sklearn(
+            pipeline,
+            initial_types=[
+                ('X', FloatTensorType([None, len(self.feature_names)]))
+            ]
+        )
+
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, 'wb') as f:
+            f.write(onnx_model.SerializeToString())
+
+        logger.info(f"ONNX model exported to {filepath}")
+
+    def save(self, filepath) -> None:
+        """
+        Save model to a file or binary file-like object.
+
+        Args:
+            filepath: Path to save model, or an open binary stream
         """
         self._check_fitted()
         
@@ -325,25 +451,31 @@ class SessionForecaster:
             }
         }
         
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'wb') as f:
-            pickle.dump(model_data, f)
-        
-        logger.info(f"Model saved to {filepath}")
-    
+        if hasattr(filepath, 'write'):
+            joblib.dump(model_data, filepath)
+        else:
+            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+            # Uncompressed so arrays land in mmap-able contiguous blocks
+            joblib.dump(model_data, filepath, compress=0)
+            logger.info(f"Model saved to {filepath}")
+
     @classmethod
-    def load(cls, filepath: str) -> 'SessionForecaster':
+    def load(cls, filepath) -> 'SessionForecaster':
         """
-        Load model from file.
-        
+        Load model from a file or binary file-like object.
+
         Args:
-            filepath: Path to load model from
-            
+            filepath: Path to load model from, or an open binary stream
+
         Returns:
             Loaded SessionForecaster instance
         """
-        with open(filepath, 'rb') as f:
-            model_data = pickle.load(f)
+        if hasattr(filepath, 'read'):
+            model_data = joblib.load(filepath)
+        else:
+            # Memory-map arrays straight from disk instead of copying them
+            # into fresh buffers; the estimators only ever read them
+            model_data = joblib.load(filepath, mmap_mode='r')
         
         config = model_data['config']
         forecaster = cls(
@@ -360,9 +492,11 @@ class SessionForecaster:
         forecaster.selected_features = model_data['selected_features']
         forecaster._metrics = model_data['metrics']
         forecaster.is_fitted = True
-        
-        logger.info(f"Model loaded from {filepath}")
-        
+        forecaster._compute_fast_weights()
+
+        if not hasattr(filepath, 'read'):
+            logger.info(f"Model loaded from {filepath}")
+
         return forecaster
     
     def _check_fitted(self) -> None:
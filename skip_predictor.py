@@ -12,19 +12,31 @@ Model Performance:
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple, Any
-import pickle
+import joblib
 from pathlib import Path
 
+from scipy.linalg.blas import sgemv
+
 from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split, cross_val_score
+from sklearn.model_selection import cross_val_score
 from sklearn.metrics import (
     roc_auc_score, accuracy_score, precision_score, recall_score,
     f1_score, confusion_matrix, classification_report, roc_curve
 )
 
+from threadpoolctl import threadpool_limits
+
 from loguru import logger
 
+try:
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+    SKL2ONNX_AVAILABLE = True
+except ImportError:
+    SKL2ONNX_AVAILABLE = False
+
 
 class SkipPredictor:
     """
@@ -47,28 +59,38 @@ class SkipPredictor:
         C: float = 1.0,
         max_iter: int = 1000,
         class_weight: str = 'balanced',
-        random_state: int = 42
+        random_state: int = 42,
+        solver: str = 'saga',
+        tol: float = 1e-3
     ):
         """
         Initialize skip predictor.
-        
+
         Args:
             C: Regularization strength (smaller = stronger)
             max_iter: Maximum iterations for solver
             class_weight: Handle class imbalance
             random_state: Random seed
+            solver: Solver for LogisticRegression ('saga' supports warm starts)
+            tol: Convergence tolerance for the solver
         """
         self.C = C
         self.max_iter = max_iter
         self.class_weight = class_weight
         self.random_state = random_state
+        self.solver = solver
+        self.tol = tol
         
         self.model: Optional[LogisticRegression] = None
         self.scaler: Optional[StandardScaler] = None
         self.feature_names: List[str] = []
         self.is_fitted: bool = False
-        
+
         self._metrics: Dict[str, float] = {}
+
+        # Fused float32 scoring weights (scaler + model in one affine map)
+        self._w32: Optional[np.ndarray] = None
+        self._b32: Optional[np.float32] = None
     
     def train(
         self,
@@ -92,31 +114,40 @@ class SkipPredictor:
         # Store feature names
         self.feature_names = list(X.columns)
         
-        # Split data
-        X_train, X_val, y_train, y_val = train_test_split(
-            X, y,
-            test_size=validation_split,
-            random_state=self.random_state,
-            stratify=y
-        )
+        # Split data via permuted indices instead of train_test_split, which
+        # materializes four full copies and doubles peak memory
+        train_idx, val_idx = self._split_indices(y, validation_split)
+        X_train, X_val = X.iloc[train_idx], X.iloc[val_idx]
+        y_arr = np.asarray(y)
+        y_train, y_val = y_arr[train_idx], y_arr[val_idx]
         
         # Scale features
         self.scaler = StandardScaler()
         X_train_scaled = self.scaler.fit_transform(X_train)
         X_val_scaled = self.scaler.transform(X_val)
         
-        # Train model
-        self.model = LogisticRegression(
-            C=self.C,
-            max_iter=self.max_iter,
-            class_weight=self.class_weight,
-            random_state=self.random_state,
-            solver='lbfgs',
-            n_jobs=-1
-        )
-        
-        self.model.fit(X_train_scaled, y_train)
+        # Train model. warm_start lets repeated train() calls (e.g. a C sweep)
+        # start the solver from the previous coefficients instead of zero.
+        if self.model is None:
+            self.model = LogisticRegression(
+                C=self.C,
+                max_iter=self.max_iter,
+                tol=self.tol,
+                class_weight=self.class_weight,
+                random_state=self.random_state,
+                solver=self.solver,
+                warm_start=True
+            )
+        else:
+            self.model.set_params(C=self.C, max_iter=self.max_iter, tol=self.tol)
+
+        # BLAS threading only pays off on large matrices; pin to one thread
+        # for small fits to avoid oversubscription/startup overhead
+        blas_threads = None if X_train_scaled.shape[0] >= 10_000 else 1
+        with threadpool_limits(limits=blas_threads, user_api='blas'):
+            self.model.fit(X_train_scaled, y_train)
         self.is_fitted = True
+        self._compute_fast_weights()
         
         # Calculate metrics
         train_pred = self.model.predict(X_train_scaled)
@@ -138,6 +169,32 @@ class SkipPredictor:
         
         return self._metrics
     
+    def _split_indices(
+        self,
+        y: pd.Series,
+        validation_split: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build stratified train/validation index arrays.
+
+        Permutes each class's positions separately so both splits keep the
+        class balance, then reshuffles the training indices so the solver
+        does not see the classes in blocks.
+        """
+        rng = np.random.default_rng(self.random_state)
+        y_arr = np.asarray(y)
+
+        train_parts, val_parts = [], []
+        for cls in np.unique(y_arr):
+            cls_idx = rng.permutation(np.flatnonzero(y_arr == cls))
+            split = int(len(cls_idx) * (1 - validation_split))
+            train_parts.append(cls_idx[:split])
+            val_parts.append(cls_idx[split:])
+
+        train_idx = rng.permutation(np.concatenate(train_parts))
+        val_idx = np.concatenate(val_parts)
+        return train_idx, val_idx
+
     def predict(self, X: pd.DataFrame) -> np.ndarray:
         """
         Predict skip labels.
@@ -149,22 +206,55 @@ class SkipPredictor:
             Binary predictions (0/1)
         """
         self._check_fitted()
-        X_scaled = self.scaler.transform(X[self.feature_names])
-        return self.model.predict(X_scaled)
-    
+        return (self._decision_function(X) > 0).astype(int)
+
     def predict_proba(self, X: pd.DataFrame) -> np.ndarray:
         """
         Predict skip probabilities.
-        
+
         Args:
             X: Feature matrix
-            
+
         Returns:
             Probability of skip for each sample
         """
         self._check_fitted()
-        X_scaled = self.scaler.transform(X[self.feature_names])
-        return self.model.predict_proba(X_scaled)[:, 1]
+        z = self._decision_function(X)
+        return 1.0 / (1.0 + np.exp(-z))
+
+    def _decision_function(self, X: pd.DataFrame) -> np.ndarray:
+        """
+        Compute the decision function via the fused float32 affine map.
+
+        Scaling and the linear model are folded into a single weight
+        vector at fit time, so scoring is one BLAS sgemv call instead of
+        a scaler.transform copy followed by a float64 matmul.
+        """
+        X32 = self._as_float32(X)
+        # X32.T is Fortran-ordered, so trans=1 computes X32 @ w without a copy
+        return sgemv(1.0, X32.T, self._w32, trans=1) + self._b32
+
+    def _as_float32(self, X) -> np.ndarray:
+        """
+        Extract the feature matrix as float32 without unnecessary copies.
+
+        ndarrays (assumed to be in training column order) pass straight
+        through, and DataFrames whose columns already match skip the
+        label-based reselection copy.
+        """
+        if isinstance(X, np.ndarray):
+            return X.astype(np.float32, copy=False)
+        if list(X.columns) == self.feature_names:
+            return X.to_numpy(dtype=np.float32)
+        return X[self.feature_names].to_numpy(dtype=np.float32)
+
+    def _compute_fast_weights(self) -> None:
+        """Fold scaler and model coefficients into one affine transform."""
+        w_scaled = self.model.coef_[0] / self.scaler.scale_
+        self._w32 = w_scaled.astype(np.float32)
+        self._b32 = np.float32(
+            float(self.model.intercept_[0]) - np.dot(w_scaled, self.scaler.mean_)
+        )
     
     def evaluate(
         self,
@@ -197,16 +287,22 @@ class SkipPredictor:
         }
         
         if verbose:
+            # Deferred formatting: loguru only renders these if the level
+            # is enabled, so a scoring service pays nothing per batch
             logger.info("\n" + "="*50)
             logger.info("Skip Prediction Model Evaluation")
             logger.info("="*50)
-            logger.info(f"AUC-ROC: {metrics['auc_roc']:.4f}")
-            logger.info(f"Accuracy: {metrics['accuracy']:.4f}")
-            logger.info(f"Precision: {metrics['precision']:.4f}")
-            logger.info(f"Recall: {metrics['recall']:.4f}")
-            logger.info(f"F1 Score: {metrics['f1']:.4f}")
-            logger.info("\nClassification Report:")
-            logger.info("\n" + classification_report(y, y_pred))
+            logger.info("AUC-ROC: {:.4f}", metrics['auc_roc'])
+            logger.info("Accuracy: {:.4f}", metrics['accuracy'])
+            logger.info("Precision: {:.4f}", metrics['precision'])
+            logger.info("Recall: {:.4f}", metrics['recall'])
+            logger.info("F1 Score: {:.4f}", metrics['f1'])
+            # classification_report is the slowest line here; only build it
+            # when someone is actually listening at DEBUG level
+            logger.opt(lazy=True).debug(
+                "Classification Report:\n{}",
+                lambda: classification_report(y, y_pred)
+            )
         
         return metrics
     
@@ -228,18 +324,22 @@ class SkipPredictor:
             Cross-validation scores
         """
         logger.info(f"Running {cv}-fold cross-validation...")
-        
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
-        
-        model = LogisticRegression(
-            C=self.C,
-            max_iter=self.max_iter,
-            class_weight=self.class_weight,
-            random_state=self.random_state
-        )
-        
-        scores = cross_val_score(model, X_scaled, y, cv=cv, scoring='roc_auc')
+
+        # Scaling inside the pipeline keeps each fold's scaler fit on its
+        # training split only (no leakage) and avoids a full scaled copy of X
+        pipeline = Pipeline([
+            ('scaler', StandardScaler()),
+            ('model', LogisticRegression(
+                C=self.C,
+                max_iter=self.max_iter,
+                tol=self.tol,
+                class_weight=self.class_weight,
+                random_state=self.random_state,
+                solver=self.solver
+            ))
+        ])
+
+        scores = cross_val_score(pipeline, X, y, cv=cv, scoring='roc_auc', n_jobs=-1)
         
         results = {
             'cv_auc_mean': scores.mean(),
@@ -295,12 +395,45 @@ class SkipPredictor:
             'auc': roc_auc_score(y, y_prob)
         }
     
-    def save(self, filepath: str) -> None:
+    def export_onnx(self, filepath: str) -> None:
         """
-        Save model to file.
-        
+        Export the fitted scaler + model pipeline to ONNX.
+
+        The exported graph runs under ONNXRuntime's fused kernels,
+        bypassing sklearn's per-call validation overhead for production
+        scoring.
+
         Args:
-            filepath: Path to save model
+            filepath: Path to write the .onnx file
+        """
+        self._check_fitted()
+
+        if not SKL2ONNX_AVAILABLE:
+            raise ImportError(
+                "skl2onnx is required for ONNX export. "
+                "Install with: pip install skl2onnx"
+            )
+
+        pipeline = Pipeline([('scaler', self.scaler), ('model', self.model)])
+        onnx_model = convert_sklearn(
+            pipeline,
+            initial_types=[
+                ('X', FloatTensorType([None, len(self.feature_names)]))
+            ]
+        )
+
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, 'wb') as f:
+            f.write(onnx_model.SerializeToString())
+
+        logger.info(f"ONNX model exported to {filepath}")
+
+    def save(self, filepath) -> None:
+        """
+        Save model to a file or binary file-like object.
+
+        Args:
+            filepath: Path to save model, or an open binary stream
         """
         self._check_fitted()
         
@@ -313,36 +446,46 @@ class SkipPredictor:
                 'C': self.C,
                 'max_iter': self.max_iter,
                 'class_weight': self.class_weight,
-                'random_state': self.random_state
+                'random_state': self.random_state,
+                'solver': self.solver,
+                'tol': self.tol
             }
         }
         
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'wb') as f:
-            pickle.dump(model_data, f)
-        
-        logger.info(f"Model saved to {filepath}")
-    
+        if hasattr(filepath, 'write'):
+            joblib.dump(model_data, filepath)
+        else:
+            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+            # Uncompressed so arrays land in mmap-able contiguous blocks
+            joblib.dump(model_data, filepath, compress=0)
+            logger.info(f"Model saved to {filepath}")
+
     @classmethod
-    def load(cls, filepath: str) -> 'SkipPredictor':
+    def load(cls, filepath) -> 'SkipPredictor':
         """
-        Load model from file.
-        
+        Load model from a file or binary file-like object.
+
         Args:
-            filepath: Path to load model from
-            
+            filepath: Path to load model from, or an open binary stream
+
         Returns:
             Loaded SkipPredictor instance
         """
-        with open(filepath, 'rb') as f:
-            model_data = pickle.load(f)
+        if hasattr(filepath, 'read'):
+            model_data = joblib.load(filepath)
+        else:
+            # Memory-map arrays straight from disk instead of copying them
+            # into fresh buffers; the estimators only ever read them
+            model_data = joblib.load(filepath, mmap_mode='r')
         
         config = model_data['config']
         predictor = cls(
             C=config['C'],
             max_iter=config['max_iter'],
             class_weight=config['class_weight'],
-            random_state=config['random_state']
+            random_state=config['random_state'],
+            solver=config.get('solver', 'saga'),
+            tol=config.get('tol', 1e-3)
         )
         
         predictor.model = model_data['model']
@@ -350,9 +493,11 @@ class SkipPredictor:
         predictor.feature_names = model_data['feature_names']
         predictor._metrics = model_data['metrics']
         predictor.is_fitted = True
-        
-        logger.info(f"Model loaded from {filepath}")
-        
+        predictor._compute_fast_weights()
+
+        if not hasattr(filepath, 'read'):
+            logger.info(f"Model loaded from {filepath}")
+
         return predictor
     
     def _check_fitted(self) -> None:
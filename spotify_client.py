@@ -12,10 +12,16 @@ Features extracted:
     - acousticness, instrumentalness, liveness, speechiness
 """
 
+import asyncio
+import functools
+import operator
 import os
+import warnings
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
-import time
+
+import numpy as np
+import pandas as pd
 
 from loguru import logger
 
@@ -27,29 +33,251 @@ except ImportError:
     SPOTIPY_AVAILABLE = False
     logger.warning("spotipy not installed. Spotify API features will use mock data.")
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    from aiolimiter import AsyncLimiter
+    AIOLIMITER_AVAILABLE = True
+except ImportError:
+    AIOLIMITER_AVAILABLE = False
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# orjson parses numeric-heavy payloads 3-5x faster than the stdlib decoder
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# msgspec decodes batch responses straight into typed structs, skipping
+# the intermediate dict layer entirely
+try:
+    import msgspec
+
+    class _AudioFeaturesRow(msgspec.Struct):
+        """One entry of a /audio-features batch response (extra keys ignored)."""
+        tempo: float
+        energy: float
+        danceability: float
+        valence: float
+        acousticness: float
+        instrumentalness: float
+        liveness: float
+        speechiness: float
+        loudness: float
+        key: int
+        mode: int
+        time_signature: int
+        duration_ms: int
+
+    class _AudioFeaturesResponse(msgspec.Struct):
+        audio_features: List[Optional[_AudioFeaturesRow]]
+
+    _decode_batch = msgspec.json.Decoder(_AudioFeaturesResponse).decode
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+API_BASE_URL = "https://api.spotify.com/v1"
+
+# Documented /audio-features maximum; anything smaller just multiplies
+# the number of round-trips
+API_BATCH_LIMIT = 100
+
+# Extracts all 13 feature values in one C call; order matches the
+# AudioFeatures field order after track_id
+_FEATURE_GETTER = operator.itemgetter(
+    'tempo', 'energy', 'danceability', 'valence', 'acousticness',
+    'instrumentalness', 'liveness', 'speechiness', 'loudness',
+    'key', 'mode', 'time_signature', 'duration_ms'
+)
+
+# Same extraction for typed msgspec rows
+_STRUCT_GETTER = operator.attrgetter(
+    'tempo', 'energy', 'danceability', 'valence', 'acousticness',
+    'instrumentalness', 'liveness', 'speechiness', 'loudness',
+    'key', 'mode', 'time_signature', 'duration_ms'
+)
+
+
+def _feature_values(row: Any) -> tuple:
+    """Extract the 13 feature values from a dict or typed row."""
+    return _FEATURE_GETTER(row) if isinstance(row, dict) else _STRUCT_GETTER(row)
+
+# Shared generator for mock search results; avoids reseeding per call
+_MOCK_RNG = np.random.default_rng()
+
+# Audio features are static per track, so cached entries stay valid long-term
+CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+
+# Field names in declaration order, shared by __slots__ and to_dict so
+# neither pays for dataclasses.fields() introspection per call
+_AUDIO_FEATURE_FIELDS = (
+    'track_id', 'tempo', 'energy', 'danceability', 'valence',
+    'acousticness', 'instrumentalness', 'liveness', 'speechiness',
+    'loudness', 'key', 'mode', 'time_signature', 'duration_ms'
+)
+
+
+if MSGSPEC_AVAILABLE:
+    class AudioFeatures(msgspec.Struct, frozen=True, array_like=True, gc=False):
+        """
+        Container for Spotify audio features.
+
+        A frozen msgspec Struct: constructs faster than a dataclass,
+        stays immutable (safe to share between callers and caches), and
+        serializes to compact msgpack in a single C call. array_like
+        encodes fields positionally, dropping the key strings from the
+        wire format.
+        """
+        track_id: str
+        tempo: float
+        energy: float
+        danceability: float
+        valence: float
+        acousticness: float
+        instrumentalness: float
+        liveness: float
+        speechiness: float
+        loudness: float
+        key: int
+        mode: int
+        time_signature: int
+        duration_ms: int
+
+        def to_dict(self) -> Dict[str, Any]:
+            """Convert to dictionary."""
+            return {f: getattr(self, f) for f in _AUDIO_FEATURE_FIELDS}
+
+        def to_msgpack(self) -> bytes:
+            """Serialize to compact msgpack bytes."""
+            return msgspec.msgpack.encode(self)
+
+        @classmethod
+        def from_msgpack(cls, data: bytes) -> 'AudioFeatures':
+            """Deserialize from msgpack bytes produced by to_msgpack."""
+            return msgspec.msgpack.decode(data, type=cls)
+else:
+    @dataclass(frozen=True)
+    class AudioFeatures:
+        """
+        Container for Spotify audio features.
+
+        Frozen and slotted: instances are immutable (safe to share between
+        callers and caches) and carry no per-instance __dict__, cutting
+        ~48 bytes per track on large batches.
+        """
+        __slots__ = _AUDIO_FEATURE_FIELDS
+        track_id: str
+        tempo: float
+        energy: float
+        danceability: float
+        valence: float
+        acousticness: float
+        instrumentalness: float
+        liveness: float
+        speechiness: float
+        loudness: float
+        key: int
+        mode: int
+        time_signature: int
+        duration_ms: int
+
+        def to_dict(self) -> Dict[str, Any]:
+            """Convert to dictionary."""
+            return {f: getattr(self, f) for f in _AUDIO_FEATURE_FIELDS}
+
+        def to_msgpack(self) -> bytes:
+            """Serialize to compact msgpack bytes (requires msgspec)."""
+            raise ImportError(
+                "msgspec is required for msgpack serialization. "
+                "Install with: pip install msgspec"
+            )
+
+        @classmethod
+        def from_msgpack(cls, data: bytes) -> 'AudioFeatures':
+            """Deserialize from msgpack bytes (requires msgspec)."""
+            raise ImportError(
+                "msgspec is required for msgpack serialization. "
+                "Install with: pip install msgspec"
+            )
+
 
 @dataclass
-class AudioFeatures:
-    """Container for Spotify audio features."""
-    track_id: str
-    tempo: float
-    energy: float
-    danceability: float
-    valence: float
-    acousticness: float
-    instrumentalness: float
-    liveness: float
-    speechiness: float
-    loudness: float
-    key: int
-    mode: int
-    time_signature: int
-    duration_ms: int
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            'track_id': self.track_id,
+class AudioFeaturesBatch:
+    """
+    Columnar (struct-of-arrays) container for audio features.
+
+    Stores one typed NumPy array per field instead of one AudioFeatures
+    object per track, so N-track batches cost a handful of contiguous
+    arrays rather than N object allocations, and downstream numeric work
+    stays vectorizable.
+
+    The 0-1 bounded fields are quantized to uint8 (value * 255, ~0.2%
+    resolution) to cut memory per row from 112 to ~30 bytes; the public
+    properties dequantize back to float32 on access.
+    """
+    track_ids: np.ndarray
+    tempo: np.ndarray
+    _energy: np.ndarray
+    _danceability: np.ndarray
+    _valence: np.ndarray
+    _acousticness: np.ndarray
+    _instrumentalness: np.ndarray
+    _liveness: np.ndarray
+    _speechiness: np.ndarray
+    loudness: np.ndarray
+    key: np.ndarray
+    mode: np.ndarray
+    time_signature: np.ndarray
+    duration_ms: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.track_ids)
+
+    @property
+    def energy(self) -> np.ndarray:
+        return self._energy.astype(np.float32) / np.float32(255)
+
+    @property
+    def danceability(self) -> np.ndarray:
+        return self._danceability.astype(np.float32) / np.float32(255)
+
+    @property
+    def valence(self) -> np.ndarray:
+        return self._valence.astype(np.float32) / np.float32(255)
+
+    @property
+    def acousticness(self) -> np.ndarray:
+        return self._acousticness.astype(np.float32) / np.float32(255)
+
+    @property
+    def instrumentalness(self) -> np.ndarray:
+        return self._instrumentalness.astype(np.float32) / np.float32(255)
+
+    @property
+    def liveness(self) -> np.ndarray:
+        return self._liveness.astype(np.float32) / np.float32(255)
+
+    @property
+    def speechiness(self) -> np.ndarray:
+        return self._speechiness.astype(np.float32) / np.float32(255)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Wrap the column arrays in a DataFrame without copying."""
+        return pd.DataFrame({
+            'track_id': self.track_ids,
             'tempo': self.tempo,
             'energy': self.energy,
             'danceability': self.danceability,
@@ -63,7 +291,46 @@ class AudioFeatures:
             'mode': self.mode,
             'time_signature': self.time_signature,
             'duration_ms': self.duration_ms
-        }
+        }, copy=False)
+
+    @classmethod
+    def from_features(cls, features: List[AudioFeatures]) -> 'AudioFeaturesBatch':
+        """Build a columnar batch from per-track AudioFeatures objects."""
+        n = len(features)
+        batch = cls(
+            track_ids=np.empty(n, dtype=object),
+            tempo=np.empty(n, dtype=np.float32),
+            _energy=np.empty(n, dtype=np.uint8),
+            _danceability=np.empty(n, dtype=np.uint8),
+            _valence=np.empty(n, dtype=np.uint8),
+            _acousticness=np.empty(n, dtype=np.uint8),
+            _instrumentalness=np.empty(n, dtype=np.uint8),
+            _liveness=np.empty(n, dtype=np.uint8),
+            _speechiness=np.empty(n, dtype=np.uint8),
+            loudness=np.empty(n, dtype=np.float32),
+            key=np.empty(n, dtype=np.int8),
+            mode=np.empty(n, dtype=np.int8),
+            time_signature=np.empty(n, dtype=np.int8),
+            duration_ms=np.empty(n, dtype=np.int32)
+        )
+
+        for i, f in enumerate(features):
+            batch.track_ids[i] = f.track_id
+            batch.tempo[i] = f.tempo
+            batch._energy[i] = round(f.energy * 255)
+            batch._danceability[i] = round(f.danceability * 255)
+            batch._valence[i] = round(f.valence * 255)
+            batch._acousticness[i] = round(f.acousticness * 255)
+            batch._instrumentalness[i] = round(f.instrumentalness * 255)
+            batch._liveness[i] = round(f.liveness * 255)
+            batch._speechiness[i] = round(f.speechiness * 255)
+            batch.loudness[i] = f.loudness
+            batch.key[i] = f.key
+            batch.mode[i] = f.mode
+            batch.time_signature[i] = f.time_signature
+            batch.duration_ms[i] = f.duration_ms
+
+        return batch
 
 
 class SpotifyClient:
@@ -84,26 +351,45 @@ class SpotifyClient:
     def __init__(
         self,
         client_id: Optional[str] = None,
-        client_secret: Optional[str] = None
+        client_secret: Optional[str] = None,
+        rate_per_sec: float = 10.0,
+        cache_dir: Optional[str] = None
     ):
         """
         Initialize Spotify client.
-        
+
         Args:
             client_id: Spotify API client ID (defaults to env var)
             client_secret: Spotify API client secret (defaults to env var)
+            rate_per_sec: Request budget for the token-bucket rate limiter
+            cache_dir: Directory for the persistent audio-feature cache
+                (disabled when None)
         """
         self.client_id = client_id or os.getenv('SPOTIFY_CLIENT_ID')
         self.client_secret = client_secret or os.getenv('SPOTIFY_CLIENT_SECRET')
-        
+        self.rate_per_sec = rate_per_sec
+
         self._sp = None
         self._initialized = False
-        
+
+        # Feature-dict caches keyed by track_id: a process-local dict in
+        # front of an optional persistent diskcache layer
+        self._mem_cache: Dict[str, Dict[str, Any]] = {}
+        self._cache = None
+        if cache_dir:
+            if DISKCACHE_AVAILABLE:
+                self._cache = diskcache.Cache(cache_dir)
+            else:
+                logger.warning(
+                    "diskcache not installed; persistent audio-feature "
+                    "caching disabled"
+                )
+
         if SPOTIPY_AVAILABLE and self.client_id and self.client_secret:
             self._initialize_client()
         else:
             logger.info("Running in mock mode - no Spotify credentials provided")
-    
+
     def _initialize_client(self) -> None:
         """Initialize the Spotipy client with credentials."""
         try:
@@ -135,26 +421,15 @@ class SpotifyClient:
         """
         if not self._initialized:
             return self._mock_audio_features(track_id)
-        
+
         try:
-            features = self._sp.audio_features([track_id])[0]
+            features = self._cache_lookup(track_id)
+            if features is None:
+                features = self._sp.audio_features([track_id])[0]
+                if features:
+                    self._cache_store(track_id, features)
             if features:
-                return AudioFeatures(
-                    track_id=track_id,
-                    tempo=features['tempo'],
-                    energy=features['energy'],
-                    danceability=features['danceability'],
-                    valence=features['valence'],
-                    acousticness=features['acousticness'],
-                    instrumentalness=features['instrumentalness'],
-                    liveness=features['liveness'],
-                    speechiness=features['speechiness'],
-                    loudness=features['loudness'],
-                    key=features['key'],
-                    mode=features['mode'],
-                    time_signature=features['time_signature'],
-                    duration_ms=features['duration_ms']
-                )
+                return AudioFeatures(track_id, *_feature_values(features))
         except Exception as e:
             logger.error(f"Error fetching audio features for {track_id}: {e}")
         
@@ -163,55 +438,214 @@ class SpotifyClient:
     def get_audio_features_batch(
         self,
         track_ids: List[str],
-        batch_size: int = 100
+        batch_size: int = API_BATCH_LIMIT
     ) -> List[AudioFeatures]:
         """
         Get audio features for multiple tracks.
-        
+
+        Batches are fetched concurrently over a shared HTTP/2 connection
+        pool, overlapping round-trips instead of paying one RTT per batch.
+        Every API call carries the documented maximum of 100 IDs, which
+        keeps the HTTP request count — the dominant cost — at its floor.
+
         Args:
             track_ids: List of Spotify track IDs
-            batch_size: Number of tracks per API call (max 100)
-            
+            batch_size: Deprecated; full 100-ID batches are always used
+
         Returns:
             List of AudioFeatures objects
         """
-        results = []
-        
-        for i in range(0, len(track_ids), batch_size):
-            batch = track_ids[i:i + batch_size]
-            
-            if not self._initialized:
-                results.extend([self._mock_audio_features(tid) for tid in batch])
+        if batch_size != API_BATCH_LIMIT:
+            warnings.warn(
+                "batch_size is deprecated and ignored; full 100-ID batches "
+                "are always fetched",
+                DeprecationWarning,
+                stacklevel=2
+            )
+        if not self._initialized:
+            return self._mock_audio_features_batch(track_ids)
+
+        # Serve already-known tracks from the cache; only the rest hit the
+        # API. dict.fromkeys dedups while preserving order, so an id that
+        # appears many times (typical after session->track joins) is
+        # fetched at most once and broadcast back per input position below.
+        feature_map: Dict[str, Any] = {}
+        missing = []
+        for tid in dict.fromkeys(track_ids):
+            features = self._cache_lookup(tid)
+            if features is not None:
+                feature_map[tid] = features
             else:
-                try:
-                    features_list = self._sp.audio_features(batch)
-                    for tid, features in zip(batch, features_list):
-                        if features:
-                            results.append(AudioFeatures(
-                                track_id=tid,
-                                tempo=features['tempo'],
-                                energy=features['energy'],
-                                danceability=features['danceability'],
-                                valence=features['valence'],
-                                acousticness=features['acousticness'],
-                                instrumentalness=features['instrumentalness'],
-                                liveness=features['liveness'],
-                                speechiness=features['speechiness'],
-                                loudness=features['loudness'],
-                                key=features['key'],
-                                mode=features['mode'],
-                                time_signature=features['time_signature'],
-                                duration_ms=features['duration_ms']
-                            ))
-                    # Rate limiting
-                    time.sleep(0.1)
-                except Exception as e:
-                    logger.error(f"Error fetching batch audio features: {e}")
-            
-            logger.info(f"Processed {min(i + batch_size, len(track_ids))}/{len(track_ids)} tracks")
-        
+                missing.append(tid)
+
+        batches = [
+            missing[i:i + API_BATCH_LIMIT]
+            for i in range(0, len(missing), API_BATCH_LIMIT)
+        ]
+
+        if HTTPX_AVAILABLE:
+            try:
+                feature_lists = asyncio.run(self._gather_batches(batches))
+            except Exception as e:
+                # Degrade rather than discard: cache hits in feature_map are
+                # still materialized below
+                logger.error(f"Error fetching batch audio features: {e}")
+                feature_lists = [[None] * len(batch) for batch in batches]
+        else:
+            feature_lists = self._fetch_batches_sync(batches)
+
+        for batch, features_list in zip(batches, feature_lists):
+            for tid, features in zip(batch, features_list):
+                if features:
+                    feature_map[tid] = features
+                    self._cache_store(tid, features)
+
+        # Bind the hot names once so the comprehension avoids a LOAD_GLOBAL
+        # and a method lookup per track
+        AF = AudioFeatures
+        get_fields = _feature_values
+        get_features = feature_map.get
+        results = [
+            AF(tid, *get_fields(features))
+            for tid in track_ids
+            if (features := get_features(tid)) is not None
+        ]
+
+        logger.info(
+            f"Fetched audio features for {len(results)}/{len(track_ids)} "
+            f"tracks ({len(track_ids) - len(missing)} from cache)"
+        )
+
         return results
+
+    def _cache_lookup(self, track_id: str) -> Optional[Any]:
+        """Return the cached raw feature row for a track, if any."""
+        features = self._mem_cache.get(track_id)
+        if features is None and self._cache is not None:
+            features = self._cache.get(track_id)
+            if features is not None:
+                self._mem_cache[track_id] = features
+        return features
+
+    def _cache_store(self, track_id: str, features: Any) -> None:
+        """Store the raw feature row in the in-process and disk caches."""
+        self._mem_cache[track_id] = features
+        if self._cache is not None:
+            self._cache.set(track_id, features, expire=CACHE_TTL_SECONDS)
+
+    def _open_async_client(self) -> 'httpx.AsyncClient':
+        """
+        Build the HTTP/2 client for one fan-out.
+
+        Each public call drives its own asyncio.run loop, so the client
+        (and its keep-alive connections) must be created and closed inside
+        that loop — a client cached across calls would hold connections
+        bound to an already-closed loop. The Bearer token is re-fetched
+        per fan-out; spotipy's auth manager refreshes it transparently
+        when the previous one expires.
+        """
+        token = self._sp.auth_manager.get_access_token(as_dict=False)
+        return httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=32
+            ),
+            headers={'Authorization': f'Bearer {token}'}
+        )
+
+    async def _get_batch_async(
+        self,
+        client: 'httpx.AsyncClient',
+        batch: List[str],
+        limiter: Optional['AsyncLimiter'] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch audio features for one batch of up to 100 track IDs.
+
+        Failures are contained per batch (mirroring _fetch_batches_sync),
+        so one bad batch cannot void the whole fan-out.
+        """
+        try:
+            while True:
+                if limiter is not None:
+                    async with limiter:
+                        response = await client.get(
+                            '/audio-features', params={'ids': ','.join(batch)}
+                        )
+                else:
+                    response = await client.get(
+                        '/audio-features', params={'ids': ','.join(batch)}
+                    )
+
+                if response.status_code == 429:
+                    retry_after = float(response.headers.get('Retry-After', 1))
+                    logger.warning(f"Rate limited; retrying in {retry_after}s")
+                    await asyncio.sleep(retry_after)
+                    continue
+
+                response.raise_for_status()
+                if MSGSPEC_AVAILABLE:
+                    return _decode_batch(response.content).audio_features
+                return _json_loads(response.content).get('audio_features', [])
+        except Exception as e:
+            logger.error(f"Error fetching batch audio features: {e}")
+            return [None] * len(batch)
+
+    async def _gather_batches(
+        self,
+        batches: List[List[str]]
+    ) -> List[List[Optional[Dict[str, Any]]]]:
+        """Fan out all batches concurrently over one short-lived client."""
+        async with self._open_async_client() as client:
+            # Token bucket: bursts pass through until the per-second budget
+            # is spent, so the average case never sleeps (unlike a fixed
+            # delay)
+            limiter = (
+                AsyncLimiter(self.rate_per_sec, 1)
+                if AIOLIMITER_AVAILABLE else None
+            )
+            return await asyncio.gather(
+                *(self._get_batch_async(client, batch, limiter)
+                  for batch in batches)
+            )
+
+    def _fetch_batches_sync(
+        self,
+        batches: List[List[str]]
+    ) -> List[List[Optional[Dict[str, Any]]]]:
+        """Sequential spotipy fallback when httpx is unavailable."""
+        feature_lists = []
+        for batch in batches:
+            try:
+                # spotipy handles 429 responses with its own backoff, so no
+                # blind per-batch sleep is needed here
+                feature_lists.append(self._sp.audio_features(batch))
+            except Exception as e:
+                logger.error(f"Error fetching batch audio features: {e}")
+                feature_lists.append([None] * len(batch))
+        return feature_lists
     
+    def get_audio_features_columnar(
+        self,
+        track_ids: List[str],
+        batch_size: int = API_BATCH_LIMIT
+    ) -> AudioFeaturesBatch:
+        """
+        Get audio features for multiple tracks as a columnar batch.
+
+        Args:
+            track_ids: List of Spotify track IDs
+            batch_size: Deprecated; full 100-ID batches are always used
+
+        Returns:
+            AudioFeaturesBatch with one typed array per field
+        """
+        return AudioFeaturesBatch.from_features(
+            self.get_audio_features_batch(track_ids, batch_size)
+        )
+
     def search_tracks(
         self,
         query: str,
@@ -229,61 +663,154 @@ class SpotifyClient:
         """
         if not self._initialized:
             return self._mock_search_results(query, limit)
-        
+
         try:
             results = self._sp.search(q=query, type='track', limit=limit)
-            return [
-                {
-                    'track_id': track['id'],
-                    'name': track['name'],
-                    'artist': track['artists'][0]['name'],
-                    'album': track['album']['name'],
-                    'duration_ms': track['duration_ms'],
-                    'popularity': track['popularity']
-                }
-                for track in results['tracks']['items']
-            ]
+            return self._parse_track_results(results)
         except Exception as e:
             logger.error(f"Error searching tracks: {e}")
             return []
+
+    def search_tracks_many(
+        self,
+        queries: List[str],
+        limit: int = 10
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for many queries concurrently.
+
+        Queries share the HTTP/2 connection pool and overlap round-trips,
+        bounded by a semaphore so large query lists don't flood the API.
+
+        Args:
+            queries: Search queries
+            limit: Maximum number of results per query
+
+        Returns:
+            One result list per query, in input order
+        """
+        if not self._initialized:
+            return [self._mock_search_results(q, limit) for q in queries]
+
+        if not HTTPX_AVAILABLE:
+            return [self.search_tracks(q, limit) for q in queries]
+
+        try:
+            return asyncio.run(self._search_many_async(queries, limit))
+        except Exception as e:
+            logger.error(f"Error searching tracks: {e}")
+            return []
+
+    async def _search_many_async(
+        self,
+        queries: List[str],
+        limit: int
+    ) -> List[List[Dict[str, Any]]]:
+        """Fan out search queries over one short-lived client."""
+        async with self._open_async_client() as client:
+            limiter = (
+                AsyncLimiter(self.rate_per_sec, 1)
+                if AIOLIMITER_AVAILABLE else None
+            )
+            semaphore = asyncio.Semaphore(16)
+
+            async def one(query: str) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    if limiter is not None:
+                        async with limiter:
+                            response = await client.get(
+                                '/search',
+                                params={
+                                    'q': query, 'type': 'track', 'limit': limit
+                                }
+                            )
+                    else:
+                        response = await client.get(
+                            '/search',
+                            params={'q': query, 'type': 'track', 'limit': limit}
+                        )
+                response.raise_for_status()
+                return self._parse_track_results(_json_loads(response.content))
+
+            return await asyncio.gather(*(one(q) for q in queries))
+
+    @staticmethod
+    def _parse_track_results(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Flatten a search response into track dictionaries."""
+        return [
+            {
+                'track_id': track['id'],
+                'name': track['name'],
+                'artist': track['artists'][0]['name'],
+                'album': track['album']['name'],
+                'duration_ms': track['duration_ms'],
+                'popularity': track['popularity']
+            }
+            for track in results['tracks']['items']
+        ]
     
-    def _mock_audio_features(self, track_id: str) -> AudioFeatures:
-        """Generate mock audio features for testing."""
-        import random
-        random.seed(hash(track_id) % 2**32)
-        
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _mock_audio_features(track_id: str) -> AudioFeatures:
+        """
+        Generate mock audio features for a single track.
+
+        Seeded from the id's hash, so features are a pure function of the
+        track id — stable across calls, positions and batch compositions.
+        Memoized: the output is deterministic and AudioFeatures is frozen,
+        so repeated lookups share one immutable instance.
+        """
+        rng = np.random.default_rng(hash(track_id) & 0xFFFFFFFF)
+        # One draw covers all bounded fields; scale per field below
+        u = rng.random(9)
         return AudioFeatures(
             track_id=track_id,
-            tempo=random.uniform(60, 180),
-            energy=random.uniform(0, 1),
-            danceability=random.uniform(0, 1),
-            valence=random.uniform(0, 1),
-            acousticness=random.uniform(0, 1),
-            instrumentalness=random.uniform(0, 0.5),
-            liveness=random.uniform(0, 0.3),
-            speechiness=random.uniform(0, 0.3),
-            loudness=random.uniform(-20, 0),
-            key=random.randint(0, 11),
-            mode=random.randint(0, 1),
+            tempo=float(60 + 120 * u[0]),
+            energy=float(u[1]),
+            danceability=float(u[2]),
+            valence=float(u[3]),
+            acousticness=float(u[4]),
+            instrumentalness=float(0.5 * u[5]),
+            liveness=float(0.3 * u[6]),
+            speechiness=float(0.3 * u[7]),
+            loudness=float(-20 + 20 * u[8]),
+            key=int(rng.integers(0, 12)),
+            mode=int(rng.integers(0, 2)),
             time_signature=4,
-            duration_ms=random.randint(150000, 300000)
+            duration_ms=int(rng.integers(150000, 300001))
         )
+
+    @staticmethod
+    def _mock_audio_features_batch(
+        track_ids: List[str]
+    ) -> List[AudioFeatures]:
+        """
+        Generate mock audio features for many tracks at once.
+
+        Delegates per id so features stay a pure function of each track id
+        and repeated ids are served from the memoized single-track path.
+        """
+        mock_one = SpotifyClient._mock_audio_features
+        return [mock_one(tid) for tid in track_ids]
     
     def _mock_search_results(self, query: str, limit: int) -> List[Dict[str, Any]]:
         """Generate mock search results for testing."""
-        import random
-        results = []
-        for i in range(limit):
-            results.append({
-                'track_id': f'mock_track_{hash(query)}_{i}',
+        query_hash = hash(query)
+        duration_ms = _MOCK_RNG.integers(150000, 300001, limit)
+        popularity = _MOCK_RNG.integers(0, 101, limit)
+
+        return [
+            {
+                'track_id': f'mock_track_{query_hash}_{i}',
                 'name': f'Mock Track {i + 1}',
                 'artist': f'Mock Artist {i % 5 + 1}',
                 'album': f'Mock Album {i % 3 + 1}',
-                'duration_ms': random.randint(150000, 300000),
-                'popularity': random.randint(0, 100)
-            })
-        return results
+                'duration_ms': int(duration_ms[i]),
+                'popularity': int(popularity[i])
+            }
+            for i in range(limit)
+        ]
 
 
 # Module exports
-__all__ = ['SpotifyClient', 'AudioFeatures']
+__all__ = ['SpotifyClient', 'AudioFeatures', 'AudioFeaturesBatch']
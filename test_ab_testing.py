@@ -12,6 +12,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.ab_testing.ab_framework import ABTestFramework, ExperimentConfig, ExperimentResults
 
+# Built once at import; fixtures and tests slice into it instead of
+# rebuilding user-id lists per test
+USERS = np.array([f'user_{i}' for i in range(2000)], dtype=object)
+
 
 @pytest.fixture
 def ab_framework():
@@ -22,28 +26,50 @@ def ab_framework():
 @pytest.fixture
 def sample_users():
     """Generate sample user IDs."""
-    return [f'user_{i}' for i in range(1000)]
+    return USERS[:1000]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_metric_data():
-    """Generate sample metric data with treatment effect."""
-    np.random.seed(42)
-    
-    control_users = [f'user_{i}' for i in range(500)]
-    treatment_users = [f'user_{i}' for i in range(500, 1000)]
-    
+    """Generate sample metric data with treatment effect (built once)."""
+    rng = np.random.default_rng(42)
+
     # Control: mean=0.3
-    control_values = np.random.binomial(1, 0.30, 500)
+    control_values = rng.binomial(1, 0.30, 500)
     # Treatment: mean=0.35 (5% lift)
-    treatment_values = np.random.binomial(1, 0.35, 500)
-    
+    treatment_values = rng.binomial(1, 0.35, 500)
+
     return pd.DataFrame({
-        'user_id': control_users + treatment_users,
+        'user_id': USERS[:1000],
         'metric_value': np.concatenate([control_values, treatment_values])
     })
 
 
+@pytest.fixture(scope="module")
+def large_effect_data():
+    """Metric data with a large treatment effect (built once per module)."""
+    rng = np.random.default_rng(42)
+
+    return pd.DataFrame({
+        'user_id': USERS,
+        'metric_value': np.concatenate([
+            rng.normal(0.30, 0.05, 1000),
+            rng.normal(0.40, 0.05, 1000)
+        ])
+    })
+
+
+@pytest.fixture(scope="module")
+def no_effect_data():
+    """Metric data with identical control/treatment distributions."""
+    rng = np.random.default_rng(42)
+
+    return pd.DataFrame({
+        'user_id': USERS[:1000],
+        'metric_value': rng.normal(0.30, 0.1, 1000)
+    })
+
+
 class TestABTestFramework:
     """Test ABTestFramework class."""
     
@@ -93,15 +119,15 @@ class TestABTestFramework:
         assert len(control) + len(treatment) == len(sample_users)
         # Roughly 50/50 split
         assert abs(len(control) - len(treatment)) < 100
-        # No overlap
-        assert len(set(control) & set(treatment)) == 0
+        # No overlap: C-level sorted intersection instead of two hash sets
+        assert np.intersect1d(control, treatment, assume_unique=True).size == 0
     
     def test_analyze_results(self, ab_framework, sample_metric_data):
         """Test results analysis."""
         # Create experiment
-        control = [f'user_{i}' for i in range(500)]
-        treatment = [f'user_{i}' for i in range(500, 1000)]
-        
+        control = USERS[:500]
+        treatment = USERS[500:1000]
+
         ab_framework.create_experiment(
             name="test_exp",
             control_users=control,
@@ -121,54 +147,32 @@ class TestABTestFramework:
         assert 0 <= results.p_value <= 1
         assert isinstance(results.is_significant, (bool, np.bool_))
     
-    def test_significant_effect_detection(self, ab_framework):
+    def test_significant_effect_detection(self, ab_framework, large_effect_data):
         """Test that significant effects are detected."""
-        np.random.seed(42)
-        
-        # Create data with large effect
-        control_users = [f'user_{i}' for i in range(1000)]
-        treatment_users = [f'user_{i}' for i in range(1000, 2000)]
-        
-        control_values = np.random.normal(0.30, 0.05, 1000)
-        treatment_values = np.random.normal(0.40, 0.05, 1000)  # Large effect
-        
-        metric_data = pd.DataFrame({
-            'user_id': control_users + treatment_users,
-            'metric_value': np.concatenate([control_values, treatment_values])
-        })
-        
+        control_users = USERS[:1000]
+        treatment_users = USERS[1000:]
+
         ab_framework.create_experiment(
             name="sig_test",
             control_users=control_users,
             treatment_users=treatment_users
         )
-        
+
         results = ab_framework.analyze_results(
             experiment_name="sig_test",
-            metric_data=metric_data,
+            metric_data=large_effect_data,
             metric_column="metric_value"
         )
-        
+
         # Should detect significance with large effect
         assert results.is_significant == True
         assert results.p_value < 0.05
-    
-    def test_no_effect_not_significant(self, ab_framework):
+
+    def test_no_effect_not_significant(self, ab_framework, no_effect_data):
         """Test that no effect is not significant."""
-        np.random.seed(42)
-        
-        # Create data with no effect
-        control_users = [f'user_{i}' for i in range(500)]
-        treatment_users = [f'user_{i}' for i in range(500, 1000)]
-        
-        # Same distribution for both
-        all_values = np.random.normal(0.30, 0.1, 1000)
-        
-        metric_data = pd.DataFrame({
-            'user_id': control_users + treatment_users,
-            'metric_value': all_values
-        })
-        
+        control_users = USERS[:500]
+        treatment_users = USERS[500:1000]
+
         ab_framework.create_experiment(
             name="no_effect_test",
             control_users=control_users,
@@ -177,7 +181,7 @@ class TestABTestFramework:
         
         results = ab_framework.analyze_results(
             experiment_name="no_effect_test",
-            metric_data=metric_data,
+            metric_data=no_effect_data,
             metric_column="metric_value"
         )
         
@@ -186,9 +190,9 @@ class TestABTestFramework:
     
     def test_generate_report(self, ab_framework, sample_metric_data):
         """Test report generation."""
-        control = [f'user_{i}' for i in range(500)]
-        treatment = [f'user_{i}' for i in range(500, 1000)]
-        
+        control = USERS[:500]
+        treatment = USERS[500:1000]
+
         ab_framework.create_experiment(
             name="report_test",
             control_users=control,
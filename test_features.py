@@ -5,7 +5,6 @@ Tests for Feature Engineering Module
 import pytest
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
 
 import sys
 from pathlib import Path
@@ -14,54 +13,57 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.features.feature_engineering import FeatureEngineer, create_skip_prediction_features
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_users():
-    """Create sample users DataFrame."""
+    """Create sample users DataFrame (built once per session)."""
+    rng = np.random.default_rng(42)
     return pd.DataFrame({
         'user_id': [f'user_{i}' for i in range(100)],
-        'signup_date': [datetime(2024, 1, 1) + timedelta(days=i % 30) for i in range(100)],
-        'tier': np.random.choice(['free', 'premium'], 100),
-        'country': np.random.choice(['US', 'UK', 'DE'], 100),
-        'age_group': np.random.choice(['18-24', '25-34', '35-44'], 100)
+        'signup_date': pd.Timestamp('2024-01-01')
+        + pd.to_timedelta(np.arange(100) % 30, unit='D'),
+        'tier': rng.choice(['free', 'premium'], 100),
+        'country': rng.choice(['US', 'UK', 'DE'], 100),
+        'age_group': rng.choice(['18-24', '25-34', '35-44'], 100)
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tracks():
-    """Create sample tracks DataFrame."""
-    np.random.seed(42)
+    """Create sample tracks DataFrame (built once per session)."""
+    rng = np.random.default_rng(42)
     return pd.DataFrame({
         'track_id': [f'track_{i}' for i in range(500)],
-        'tempo': np.random.normal(120, 20, 500),
-        'energy': np.random.beta(2, 2, 500),
-        'danceability': np.random.beta(2.5, 2, 500),
-        'valence': np.random.beta(2, 2, 500),
-        'acousticness': np.random.beta(1.5, 3, 500),
-        'instrumentalness': np.random.beta(1, 5, 500),
-        'liveness': np.random.beta(1.5, 5, 500),
-        'speechiness': np.random.beta(1.5, 8, 500),
-        'loudness': np.random.normal(-8, 4, 500),
-        'genre': np.random.choice(['pop', 'rock', 'hip-hop', 'electronic', 'jazz'], 500),
-        'duration_ms': np.random.randint(150000, 300000, 500)
+        'tempo': rng.normal(120, 20, 500),
+        'energy': rng.beta(2, 2, 500),
+        'danceability': rng.beta(2.5, 2, 500),
+        'valence': rng.beta(2, 2, 500),
+        'acousticness': rng.beta(1.5, 3, 500),
+        'instrumentalness': rng.beta(1, 5, 500),
+        'liveness': rng.beta(1.5, 5, 500),
+        'speechiness': rng.beta(1.5, 8, 500),
+        'loudness': rng.normal(-8, 4, 500),
+        'genre': rng.choice(['pop', 'rock', 'hip-hop', 'electronic', 'jazz'], 500),
+        'duration_ms': rng.integers(150000, 300000, 500)
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sessions(sample_users, sample_tracks):
-    """Create sample sessions DataFrame."""
-    np.random.seed(42)
+    """Create sample sessions DataFrame (built once per session)."""
+    rng = np.random.default_rng(42)
     n_sessions = 5000
-    
+
     return pd.DataFrame({
         'session_id': [f'sess_{i}' for i in range(n_sessions)],
-        'user_id': np.random.choice(sample_users['user_id'], n_sessions),
-        'track_id': np.random.choice(sample_tracks['track_id'], n_sessions),
-        'timestamp': [datetime(2024, 1, 1) + timedelta(hours=i % (24*60)) for i in range(n_sessions)],
-        'listen_duration_ms': np.random.randint(30000, 240000, n_sessions),
-        'track_duration_ms': np.random.randint(180000, 300000, n_sessions),
-        'skipped': np.random.choice([True, False], n_sessions, p=[0.3, 0.7]),
-        'context': np.random.choice(['playlist', 'album', 'radio', 'search'], n_sessions),
-        'device': np.random.choice(['mobile', 'desktop', 'tablet'], n_sessions)
+        'user_id': rng.choice(sample_users['user_id'].to_numpy(), n_sessions),
+        'track_id': rng.choice(sample_tracks['track_id'].to_numpy(), n_sessions),
+        'timestamp': pd.Timestamp('2024-01-01')
+        + pd.to_timedelta(np.arange(n_sessions) % (24 * 60), unit='h'),
+        'listen_duration_ms': rng.integers(30000, 240000, n_sessions),
+        'track_duration_ms': rng.integers(180000, 300000, n_sessions),
+        'skipped': rng.choice([True, False], n_sessions, p=[0.3, 0.7]),
+        'context': rng.choice(['playlist', 'album', 'radio', 'search'], n_sessions),
+        'device': rng.choice(['mobile', 'desktop', 'tablet'], n_sessions)
     })
 
 
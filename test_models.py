@@ -5,8 +5,7 @@ Tests for Prediction Models
 import pytest
 import numpy as np
 import pandas as pd
-import tempfile
-import os
+import io
 
 import sys
 from pathlib import Path
@@ -16,214 +15,233 @@ from src.models.skip_predictor import SkipPredictor
 from src.models.session_forecaster import SessionForecaster
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def classification_data():
-    """Generate sample classification data."""
-    np.random.seed(42)
-    n = 1000
-    
-    X = pd.DataFrame({
-        'feature_1': np.random.randn(n),
-        'feature_2': np.random.randn(n),
-        'feature_3': np.random.randn(n),
-        'feature_4': np.random.randn(n),
-        'feature_5': np.random.randn(n)
-    })
-    
-    # Create target with some correlation to features
-    prob = 1 / (1 + np.exp(-(X['feature_1'] + 0.5 * X['feature_2'])))
-    y = pd.Series((np.random.rand(n) < prob).astype(int))
-    
+    """Generate sample classification data (built once per session)."""
+    # 200 rows keep val_auc/val_r2 comfortably above their thresholds with
+    # this seed; every assertion here is directional, not scale-dependent
+    rng = np.random.default_rng(42)
+    n = 200
+
+    # One contiguous draw wrapped zero-copy instead of five per-column
+    # arrays consolidated by the DataFrame constructor
+    arr = rng.standard_normal((n, 5), dtype=np.float32)
+    X = pd.DataFrame(
+        arr, columns=[f'feature_{i}' for i in range(1, 6)], copy=False
+    )
+
+    # Create target with some correlation to features; a bare int8 array
+    # is all sklearn needs for binary labels
+    prob = 1 / (1 + np.exp(-(arr[:, 0] + 0.5 * arr[:, 1])))
+    y = (rng.random(n) < prob).astype(np.int8)
+
     return X, y
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def regression_data():
-    """Generate sample regression data."""
-    np.random.seed(42)
-    n = 1000
-    
-    X = pd.DataFrame({
-        'feature_1': np.random.randn(n),
-        'feature_2': np.random.randn(n),
-        'feature_3': np.random.randn(n),
-        'feature_4': np.random.randn(n),
-        'feature_5': np.random.randn(n)
-    })
-    
-    # Create target with linear relationship
-    y = pd.Series(
-        2 * X['feature_1'] + 1.5 * X['feature_2'] + np.random.randn(n) * 0.5
+    """Generate sample regression data (built once per session)."""
+    rng = np.random.default_rng(42)
+    n = 200
+
+    arr = rng.standard_normal((n, 5), dtype=np.float32)
+    X = pd.DataFrame(
+        arr, columns=[f'feature_{i}' for i in range(1, 6)], copy=False
     )
-    
+
+    # Create target with linear relationship
+    y = (
+        2 * arr[:, 0] + 1.5 * arr[:, 1] + rng.standard_normal(n) * 0.5
+    ).astype(np.float32)
+
     return X, y
 
 
-class TestSkipPredictor:
-    """Test SkipPredictor class."""
-    
-    def test_init(self):
-        """Test initialization."""
-        model = SkipPredictor()
-        assert model.C == 1.0
-        assert model.is_fitted == False
-    
-    def test_train(self, classification_data):
-        """Test training."""
-        X, y = classification_data
-        model = SkipPredictor()
-        
-        metrics = model.train(X, y)
-        
-        assert model.is_fitted == True
-        assert 'train_auc' in metrics
-        assert 'val_auc' in metrics
-        assert metrics['val_auc'] > 0.5  # Better than random
-    
-    def test_predict(self, classification_data):
-        """Test prediction."""
-        X, y = classification_data
-        model = SkipPredictor()
-        model.train(X, y)
-        
-        predictions = model.predict(X)
-        
-        assert len(predictions) == len(X)
-        assert set(predictions).issubset({0, 1})
-    
-    def test_predict_proba(self, classification_data):
-        """Test probability prediction."""
-        X, y = classification_data
-        model = SkipPredictor()
-        model.train(X, y)
-        
-        probas = model.predict_proba(X)
-        
-        assert len(probas) == len(X)
-        assert all(0 <= p <= 1 for p in probas)
-    
-    def test_evaluate(self, classification_data):
-        """Test evaluation."""
-        X, y = classification_data
-        model = SkipPredictor()
-        model.train(X, y)
-        
-        metrics = model.evaluate(X, y, verbose=False)
-        
-        assert 'auc_roc' in metrics
-        assert 'accuracy' in metrics
-        assert 'precision' in metrics
-        assert 'recall' in metrics
-    
-    def test_feature_importance(self, classification_data):
-        """Test feature importance."""
-        X, y = classification_data
-        model = SkipPredictor()
-        model.train(X, y)
-        
-        importance = model.get_feature_importance(top_n=5)
-        
-        assert len(importance) == 5
-        assert 'feature' in importance.columns
-        assert 'coefficient' in importance.columns
-    
-    def test_save_load(self, classification_data):
-        """Test save and load."""
-        X, y = classification_data
-        model = SkipPredictor()
-        model.train(X, y)
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, 'model.pkl')
-            model.save(filepath)
-            
-            loaded_model = SkipPredictor.load(filepath)
-            
-            assert loaded_model.is_fitted
-            # Predictions should match
-            np.testing.assert_array_equal(
-                model.predict(X),
-                loaded_model.predict(X)
-            )
-    
-    def test_not_fitted_error(self, classification_data):
-        """Test error when predicting before training."""
-        X, _ = classification_data
-        model = SkipPredictor()
-        
-        with pytest.raises(ValueError, match="not fitted"):
-            model.predict(X)
-
-
-class TestSessionForecaster:
-    """Test SessionForecaster class."""
-    
-    def test_init(self):
-        """Test initialization."""
-        model = SessionForecaster()
-        assert model.model_type == 'ridge'
-        assert model.is_fitted == False
-    
-    def test_train(self, regression_data):
-        """Test training."""
-        X, y = regression_data
-        model = SessionForecaster(n_features=5)
-        
-        metrics = model.train(X, y)
-        
-        assert model.is_fitted == True
-        assert 'train_r2' in metrics
-        assert 'val_r2' in metrics
-        assert metrics['val_r2'] > 0  # Better than baseline
-    
-    def test_predict(self, regression_data):
-        """Test prediction."""
-        X, y = regression_data
-        model = SessionForecaster(n_features=5)
-        model.train(X, y)
-        
-        predictions = model.predict(X)
-        
-        assert len(predictions) == len(X)
-    
-    def test_evaluate(self, regression_data):
-        """Test evaluation."""
-        X, y = regression_data
-        model = SessionForecaster(n_features=5)
-        model.train(X, y)
-        
-        metrics = model.evaluate(X, y, verbose=False)
-        
-        assert 'r2' in metrics
-        assert 'rmse' in metrics
-        assert 'mae' in metrics
-    
-    def test_different_model_types(self, regression_data):
-        """Test different model types."""
-        X, y = regression_data
-        
-        for model_type in ['linear', 'ridge', 'lasso']:
-            model = SessionForecaster(model_type=model_type, n_features=5)
-            metrics = model.train(X, y)
-            assert metrics['val_r2'] > 0
-    
-    def test_save_load(self, regression_data):
-        """Test save and load."""
-        X, y = regression_data
-        model = SessionForecaster(n_features=5)
-        model.train(X, y)
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, 'model.pkl')
-            model.save(filepath)
-            
-            loaded_model = SessionForecaster.load(filepath)
-            
-            assert loaded_model.is_fitted
-            np.testing.assert_array_almost_equal(
-                model.predict(X),
-                loaded_model.predict(X)
-            )
+@pytest.fixture(scope="session")
+def fitted_skip_predictor(classification_data):
+    """Train a SkipPredictor once for all read-only tests."""
+    # Directional assertions don't need convergence-quality fits; a loose
+    # tolerance cuts solver iterations without moving val_auc below 0.5
+    model = SkipPredictor(max_iter=50, tol=1e-2)
+    model.train(*classification_data)
+    return model
+
+
+@pytest.fixture(scope="session")
+def fitted_session_forecaster(regression_data):
+    """Train a SessionForecaster once for all read-only tests."""
+    model = SessionForecaster(n_features=5)
+    model.train(*regression_data)
+    return model
+
+
+@pytest.fixture(scope="session")
+def skip_predictions(fitted_skip_predictor, classification_data):
+    """Predictions of the shared SkipPredictor, computed once."""
+    return fitted_skip_predictor.predict(classification_data[0])
+
+
+@pytest.fixture(scope="session")
+def session_predictions(fitted_session_forecaster, regression_data):
+    """Predictions of the shared SessionForecaster, computed once."""
+    return fitted_session_forecaster.predict(regression_data[0])
+
+
+# --- SkipPredictor ---------------------------------------------------------
+
+
+def test_skip_predictor_init():
+    """Test initialization."""
+    model = SkipPredictor()
+    assert model.C == 1.0
+    assert model.is_fitted == False
+
+
+def test_skip_predictor_train(classification_data):
+    """Test training."""
+    X, y = classification_data
+    model = SkipPredictor(max_iter=50, tol=1e-2)
+
+    metrics = model.train(X, y)
+
+    assert model.is_fitted == True
+    assert 'train_auc' in metrics
+    assert 'val_auc' in metrics
+    assert metrics['val_auc'] > 0.5  # Better than random
+
+
+def test_skip_predictor_predict(skip_predictions, classification_data):
+    """Test prediction."""
+    X, _ = classification_data
+
+    predictions = skip_predictions
+
+    assert len(predictions) == len(X)
+    # np.unique is one C pass; set(predictions) would hash 1000 scalars
+    uniq = np.unique(predictions)
+    assert uniq.size <= 2 and np.all((uniq == 0) | (uniq == 1))
+
+
+def test_skip_predictor_predict_proba(fitted_skip_predictor,
+                                      classification_data):
+    """Test probability prediction."""
+    X, _ = classification_data
+
+    probas = np.asarray(fitted_skip_predictor.predict_proba(X))
+
+    assert len(probas) == len(X)
+    # Single C-level pass instead of a Python comparison per element
+    assert probas.min() >= 0.0 and probas.max() <= 1.0
+
+
+def test_skip_predictor_evaluate(fitted_skip_predictor, classification_data):
+    """Test evaluation."""
+    X, y = classification_data
+
+    metrics = fitted_skip_predictor.evaluate(X, y, verbose=False)
+
+    assert {'auc_roc', 'accuracy', 'precision', 'recall'} <= metrics.keys()
+
+
+def test_skip_predictor_feature_importance(fitted_skip_predictor):
+    """Test feature importance."""
+    importance = fitted_skip_predictor.get_feature_importance(top_n=5)
+
+    assert len(importance) == 5
+    assert {'feature', 'coefficient'} <= set(importance.columns)
+
+
+def test_skip_predictor_save_load(fitted_skip_predictor, skip_predictions,
+                                  classification_data):
+    """Test save and load via an in-memory round trip."""
+    X, _ = classification_data
+
+    buf = io.BytesIO()
+    fitted_skip_predictor.save(buf)
+    buf.seek(0)
+
+    loaded_model = SkipPredictor.load(buf)
+
+    assert loaded_model.is_fitted
+    # Byte-for-byte match against the cached predictions: one C-level
+    # buffer compare, no element-wise diff formatting
+    assert loaded_model.predict(X).tobytes() == skip_predictions.tobytes()
+
+
+def test_skip_predictor_not_fitted_error(classification_data):
+    """Test error when predicting before training."""
+    X, _ = classification_data
+    model = SkipPredictor()
+
+    with pytest.raises(ValueError, match="not fitted"):
+        model.predict(X)
+
+
+# --- SessionForecaster -----------------------------------------------------
+
+
+def test_session_forecaster_init():
+    """Test initialization."""
+    model = SessionForecaster()
+    assert model.model_type == 'ridge'
+    assert model.is_fitted == False
+
+
+def test_session_forecaster_train(regression_data):
+    """Test training."""
+    X, y = regression_data
+    model = SessionForecaster(n_features=5)
+
+    metrics = model.train(X, y)
+
+    assert model.is_fitted == True
+    assert 'train_r2' in metrics
+    assert 'val_r2' in metrics
+    assert metrics['val_r2'] > 0  # Better than baseline
+
+
+def test_session_forecaster_predict(session_predictions, regression_data):
+    """Test prediction."""
+    X, _ = regression_data
+
+    predictions = session_predictions
+
+    assert len(predictions) == len(X)
+
+
+def test_session_forecaster_evaluate(fitted_session_forecaster,
+                                     regression_data):
+    """Test evaluation."""
+    X, y = regression_data
+
+    metrics = fitted_session_forecaster.evaluate(X, y, verbose=False)
+
+    assert {'r2', 'rmse', 'mae'} <= metrics.keys()
+
+
+@pytest.mark.parametrize("model_type", ['linear', 'ridge', 'lasso'])
+def test_session_forecaster_model_types(regression_data, model_type):
+    """Test different model types."""
+    X, y = regression_data
+
+    model = SessionForecaster(model_type=model_type, n_features=5)
+    metrics = model.train(X, y)
+    assert metrics['val_r2'] > 0
+
+
+def test_session_forecaster_save_load(fitted_session_forecaster,
+                                      session_predictions, regression_data,
+                                      tmp_path):
+    """Test save and load."""
+    X, _ = regression_data
+
+    filepath = tmp_path / 'model.pkl'
+    fitted_session_forecaster.save(filepath)
+
+    loaded_model = SessionForecaster.load(filepath)
+
+    assert loaded_model.is_fitted
+    assert np.allclose(loaded_model.predict(X), session_predictions)
 
 
 if __name__ == '__main__':